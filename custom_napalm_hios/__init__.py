@@ -13,6 +13,6 @@
 # the License.
 
 """napalm-hios package."""
-from custom_hios import HiOSDriver  # noqa
+from custom_napalm_hios.custom_hios import HiOSDriver  # noqa
 
 __all__ = ('HiOSDriver',)
@@ -20,6 +20,8 @@ Read https://napalm.readthedocs.io for more information.
 """
 
 import re
+import socket
+
 from netmiko import ConnectHandler
 
 from napalm.base import NetworkDriver
@@ -31,6 +33,36 @@ from napalm.base.exceptions import (
     CommandErrorException,
 )
 
+# "Label...... value" lines of "show sysinfo"
+_RE_SYSINFO_KV = re.compile(r'^([^.\n]+?)\.{2,}[ \t]*(.*)$', re.MULTILINE)
+_RE_UPTIME_PARTS = re.compile(r'(\d+)\s+days?\s+(\d+)\s+hrs?\s+(\d+)\s+mins?\s+(\d+)\s+secs?')
+# Pager prompt or enable-mode prompt ending a command output
+_PAGING_EXPECT = r'(--More--|%s\s*#\s*$)'
+# _send_command_paging reads stop at the pager prompt, so it can only be on the
+# last line of each read
+_PAGER_TAIL = 64
+_RE_PORT = re.compile(r'^(\d\S+) ', re.MULTILINE)
+
+# ASCII null byte used as an SSH keepalive probe
+_NULL_BYTE = "\x00"
+
+# Netmiko possible arguments
+_NETMIKO_KEYS = frozenset({
+    "port",
+    "secret",
+    "verbose",
+    "keepalive",
+    "global_delay_factor",
+    "use_keys",
+    "key_file",
+    "ssh_strict",
+    "system_host_keys",
+    "alt_host_keys",
+    "alt_key_file",
+    "ssh_config_file",
+    "session_log",
+})
+
 
 class HiOSDriver(NetworkDriver):
     """Napalm driver for HiOS."""
@@ -46,30 +78,12 @@ class HiOSDriver(NetworkDriver):
         if optional_args is None:
             optional_args = {}
         self.transport = optional_args.get("transport", "ssh")
-        self.profile = ["hios"]
-
-        # Netmiko possible arguments
-        netmiko_argument_map = {
-            "port": None,
-            "secret": "",
-            "verbose": False,
-            "keepalive": 30,
-            "global_delay_factor": 1,
-            "use_keys": False,
-            "key_file": None,
-            "ssh_strict": False,
-            "system_host_keys": False,
-            "alt_host_keys": False,
-            "alt_key_file": "",
-            "ssh_config_file": None,
-        }
+        self.platform = "hios"
+        self.profile = [self.platform]
+
         # Build dict of any optional Netmiko args
-        self.netmiko_optional_args = {}
-        for k, v in netmiko_argument_map.items():
-            try:
-                self.netmiko_optional_args[k] = optional_args[k]
-            except KeyError:
-                pass
+        self.netmiko_optional_args = {k: optional_args[k]
+                                      for k in _NETMIKO_KEYS & optional_args.keys()}
         self.global_delay_factor = optional_args.get("global_delay_factor", 1)
         self.port = optional_args.get("port", 22)
 
@@ -84,7 +98,6 @@ class HiOSDriver(NetworkDriver):
                 host=self.hostname,
                 username=self.username,
                 password=self.password,
-                session_log="log",
                 **self.netmiko_optional_args
             )
             # ensure in enable mode
@@ -99,27 +112,26 @@ class HiOSDriver(NetworkDriver):
 
     def _send_command_paging(self, command):
         """Wrapper for self.device.send.command() with paging."""
-        output = self.device.send_command_timing(command)
-        if '--More-- or (q)uit' in output:
-            output += self.device.send_command_timing("\n")
-        return output
+        expect_string = _PAGING_EXPECT % re.escape(self.device.base_prompt.strip())
+        # keep the last line so a pager prompt is not stripped as the device prompt
+        output = chunk = self.device.send_command(command, expect_string=expect_string,
+                                                  strip_prompt=False)
+        while '--More--' in chunk[-_PAGER_TAIL:]:
+            chunk = self.device.send_command("\n", expect_string=expect_string,
+                                             strip_prompt=False, strip_command=False)
+            output += chunk
+        # same shape as a plain send_command, whether or not the output was paged
+        return self.device.strip_prompt(output)
 
     def is_alive(self):
         """ Returns a flag with the state of the connection."""
         if self.device is None:
             return {"is_alive": False}
         try:
-            if self.transport == "telnet":
-                # Try sending IAC + NOP (IAC is telnet way of sending command
-                # IAC = Interpret as Command (it comes before the NOP)
-                self.device.write_channel(telnetlib.IAC + telnetlib.NOP)
-                return {"is_alive": True}
-            else:
-                # SSH
-                # Try sending ASCII null byte to maintain the connection alive
-                null = chr(0)
-                self.device.write_channel(null)
-                return {"is_alive": self.device.remote_conn.transport.is_active()}
+            # SSH only, open() does not support telnet yet
+            # Try sending ASCII null byte to maintain the connection alive
+            self.device.write_channel(_NULL_BYTE)
+            return {"is_alive": self.device.remote_conn.transport.is_active()}
         except (socket.error, EOFError, OSError):
             # If unable to send, we can tell for sure that the connection is unusable
             return {"is_alive": False}
@@ -140,47 +152,36 @@ class HiOSDriver(NetworkDriver):
 
         show_sysinfo = self._send_command_paging("show sysinfo")
 
-        uptime = re.search(r'System Up Time\.+ (.*)',show_sysinfo,re.MULTILINE)
+        # first occurrence of a label wins, as with a per-field re.search
+        sysinfo = {}
+        for m in _RE_SYSINFO_KV.finditer(show_sysinfo):
+            sysinfo.setdefault(m.group(1).strip(), m.group(2))
+
         # 0 days 0 hrs 0 mins 0 secs
-        udict = uptime.group(1).split(" ")
-        uptime_seconds = (
-            int(int(udict[6]))
-            + int(udict[4]) * 60
-            + int(udict[2]) * 60 * 60
-            + int(udict[0]) * 60 * 60 * 24
-        )
-
-        os_version = re.search(r'Running Software Release\.+ (.*)',show_sysinfo,re.MULTILINE)
-        serial_number = re.search(r'Serial Number \(Backplane\)\.+ (.*)',show_sysinfo,re.MULTILINE)
-        model = re.search(r'Backplane Hardware Description\.+ (.*)',show_sysinfo,re.MULTILINE)
-        hostname = re.search(r'System Name\.+ (.*)',show_sysinfo,re.MULTILINE)
-
-        facts['uptime'] = uptime_seconds
-        facts['os_version'] = os_version.group(1)
-        facts['serial_number'] = serial_number.group(1)
-        facts['model'] = model.group(1)
-        facts['hostname'] = hostname.group(1)
-        facts['fqdn'] = hostname.group(1)
+        uptime = _RE_UPTIME_PARTS.search(sysinfo.get('System Up Time', ''))
+        if uptime:
+            d, h, m, s = map(int, uptime.groups())
+            facts['uptime'] = s + 60 * (m + 60 * (h + 24 * d))
+
+        facts['os_version'] = sysinfo.get('Running Software Release', facts['os_version'])
+        facts['serial_number'] = sysinfo.get('Serial Number (Backplane)', facts['serial_number'])
+        facts['model'] = sysinfo.get('Backplane Hardware Description', facts['model'])
+        facts['hostname'] = sysinfo.get('System Name', facts['hostname'])
+        facts['fqdn'] = facts['hostname']
         facts['interface_list'] = self._get_interface_list()
 
         return facts
 
     def get_config(self, retrieve="all", full=False, sanitized=False):
         """Get device config"""
-        config = {"running": "", "candidate": ""}  # default values
+        config = {"running": "", "startup": "", "candidate": ""}  # default values
 
         if retrieve.lower() in ["running", "all"]:
-            running_config = self.device.send_command("show running-config")
-            config["running"] = str(running_config)
+            config["running"] = self.device.send_command("show running-config")
             config["candidate"] = ""
         return config
 
     def _get_interface_list(self):
         """Get the list of all interfaces"""
-        interface_list = []
-
         show_port_all = self._send_command_paging("show port all")
-        for line in re.finditer(r'([0-9]\S+) .*',show_port_all,re.MULTILINE):
-            interface_list.append(line.group(1))
-
-        return interface_list
+        return [m.group(1) for m in _RE_PORT.finditer(show_port_all)]
@@ -6,7 +6,7 @@ from napalm.base.test import conftest as parent_conftest
 
 from napalm.base.test.double import BaseTestDouble
 
-from napalm_hios import hios
+from custom_napalm_hios import custom_hios as hios
 
 
 @pytest.fixture(scope='class')
@@ -22,6 +22,14 @@ def set_device_parameters(request):
     parent_conftest.set_device_parameters(request)
 
 
+@pytest.fixture
+def patched_device():
+    """Return a driver connected to the fake HiOS device."""
+    device = PatchedHiOSDriver('127.0.0.1', 'vagrant', 'vagrant')
+    device.open()
+    return device
+
+
 def pytest_generate_tests(metafunc):
     """Generate test cases dynamically."""
     parent_conftest.pytest_generate_tests(metafunc, __file__)
@@ -37,21 +45,73 @@ class PatchedHiOSDriver(hios.HiOSDriver):
         self.patched_attrs = ['device']
         self.device = FakeHiOSDevice()
 
+    def open(self):
+        """Patched open, the fake device is already connected."""
+        pass
+
 
 class FakeHiOSDevice(BaseTestDouble):
     """HiOS device test double."""
 
-    def run_commands(self, command_list, encoding='json'):
-        """Fake run_commands."""
-        result = list()
-
-        for command in command_list:
-            filename = '{}.{}'.format(self.sanitize_text(command), encoding)
-            full_path = self.find_file(filename)
-
-            if encoding == 'json':
-                result.append(self.read_json_file(full_path))
-            else:
-                result.append({'output': self.read_txt_file(full_path)})
-
-        return result
+    base_prompt = '(Hirschmann RSP) '
+
+    def __init__(self):
+        """Initiate object."""
+        super().__init__()
+        self.calls = []
+        self.remote_conn = FakeChannel()
+        self.last_command = ''
+        self.page = 1
+
+    def send_command(self, command, **kwargs):
+        """Fake send_command, recording each call with its arguments.
+
+        A "\\n" continues a paged output, served from the next <command>_<page>.txt file.
+        """
+        self.calls.append((command, kwargs))
+        if command == '\n':
+            self.page += 1
+            filename = '{}_{}.txt'.format(self.sanitize_text(self.last_command), self.page)
+        else:
+            self.last_command = command
+            self.page = 1
+            filename = '{}.txt'.format(self.sanitize_text(command))
+        output = self.read_txt_file(self.find_file(filename))
+        if kwargs.get('strip_prompt', True):
+            output = self.strip_prompt(output)
+        return output
+
+    def strip_prompt(self, a_string):
+        """Strip the trailing prompt line, as netmiko does."""
+        lines = a_string.split('\n')
+        if self.base_prompt in lines[-1]:
+            return '\n'.join(lines[:-1])
+        return a_string
+
+    def write_channel(self, out_data):
+        """Fake write_channel, failing if the test case has a write_channel_error.txt."""
+        try:
+            error = self.read_txt_file(self.find_file('write_channel_error.txt'))
+        except IOError:
+            return
+        raise OSError(error.strip())
+
+    def disconnect(self):
+        """Fake disconnect."""
+        pass
+
+
+class FakeChannel(object):
+    """Paramiko channel test double."""
+
+    def __init__(self):
+        """Initiate object."""
+        self.transport = FakeTransport()
+
+
+class FakeTransport(object):
+    """Paramiko transport test double, always active."""
+
+    def is_active(self):
+        """Fake is_active."""
+        return True
@@ -0,0 +1,35 @@
+"""Tests for paged command output."""
+
+# expect pattern built from FakeHiOSDevice.base_prompt
+EXPECT_STRING = r'(--More--|\(Hirschmann\ RSP\)\s*#\s*$)'
+
+
+def test_paged_output(patched_device):
+    """Each page is read up to the pager or the device prompt."""
+    fake = patched_device.device
+    fake.current_test = 'test_get_facts'
+    fake.current_test_case = 'paged'
+
+    patched_device.get_facts()
+
+    assert fake.calls == [
+        ('show sysinfo', {'expect_string': EXPECT_STRING, 'strip_prompt': False}),
+        ('\n', {'expect_string': EXPECT_STRING, 'strip_prompt': False,
+                'strip_command': False}),
+        ('show port all', {'expect_string': EXPECT_STRING, 'strip_prompt': False}),
+        ('\n', {'expect_string': EXPECT_STRING, 'strip_prompt': False,
+                'strip_command': False}),
+    ]
+
+
+def test_paged_output_strips_prompt(patched_device):
+    """Paged and unpaged outputs both come back without the trailing prompt."""
+    fake = patched_device.device
+    fake.current_test = 'test_get_facts'
+
+    for test_case in ('normal', 'paged'):
+        fake.current_test_case = test_case
+        output = patched_device._send_command_paging('show sysinfo')
+
+        assert fake.base_prompt.strip() not in output
+        assert 'Backplane Hardware Description' in output